@@ -23,7 +23,7 @@ https://docs.streamlit.io/get-started/fundamentals/main-concepts
 
 #1. IMPORT LIBRARIES
 
-import math                          # for simple decade/century math
+import itertools                     # for cycling through layout columns
 import pandas as pd                  # for data handling
 import numpy as np                   # for numeric helpers
 import streamlit as st               # for the web app
@@ -32,51 +32,102 @@ import plotly.express as px          # for charts
 
 
 #2. LOAD AND CLEAN DATA
-@st.cache_data
+@st.cache_data(persist="disk")
 def load_data():
     """
-    Read the CSV and do basic cleaning.
-
-    st.cache_data tells Streamlit to remember the result,
-    so it doesn't re-load the file every time.
+    Read the data, do basic cleaning, and precompute the small summary
+    facts the sidebar needs (year limits, max lives lost, vessel types).
+    Returns (df, meta).
+
+    The cleaned, typed DataFrame is saved to Parquet the first time
+    through, so later cold starts read it back directly instead of
+    re-parsing the CSV and redoing all the cleaning. st.cache_data with
+    persist="disk" keeps the result across app restarts too.
     """
-    df = pd.read_csv("ShipwreckDatabase.csv")
-
-    # Convert some columns to numbers (in case they are stored as text) #Chapter 11
-    df["YEAR"] = pd.to_numeric(df["YEAR"], errors="coerce")
-    df["LIVES LOST"] = pd.to_numeric(df["LIVES LOST"], errors="coerce")
-    df["LATITUDE"] = pd.to_numeric(df["LATITUDE"], errors="coerce")
-    df["LONGITUDE"] = pd.to_numeric(df["LONGITUDE"], errors="coerce")
-
-
-    #[COLUMNS] We ADD a new helper column for lives lost with missing values filled.
-    #Make a new column called LIVES_LOST_CLEAN where missing lives-lost values are treated
-    #as 0 and everything is stored as whole numbers.
-    df["LIVES_LOST_CLEAN"] = df["LIVES LOST"].fillna(0).astype(int)
-
-    #[LAMBDA] We use lambda functions to make new DECADE and CENTURY columns.
-    df["DECADE"] = df["YEAR"].apply(
-        lambda y: int(y // 10 * 10) if pd.notna(y) else np.nan
-    ) #For each value in the year column, if it’s not missing, cut it down to the nearest decade (like 1895 to 1890).
-    # If the year is missing, keep it missing. Save all those decade values in a new column called DECADE
-
-    # [LAMBDA]
-    df["CENTURY"] = df["YEAR"].apply(
-        lambda y: int(math.floor(y / 100) + 1) if pd.notna(y) else np.nan
-    ) #For each year, figure out which century it belongs to (like 1895 becomes 19th century)
-    # store that in a new column called CENTURY. Leave it missing if the year is missing
+    try:
+        #Fast path: the cleaned data was already saved with its dtypes intact.
+        df = pd.read_parquet("ShipwreckDatabase.parquet")
+    except (FileNotFoundError, ImportError, OSError):
+        df = pd.read_csv("ShipwreckDatabase.csv")
+
+        # Convert some columns to numbers (in case they are stored as text) #Chapter 11
+        df["YEAR"] = pd.to_numeric(df["YEAR"], errors="coerce")
+        df["LIVES LOST"] = pd.to_numeric(df["LIVES LOST"], errors="coerce")
+        df["LATITUDE"] = pd.to_numeric(df["LATITUDE"], errors="coerce")
+        df["LONGITUDE"] = pd.to_numeric(df["LONGITUDE"], errors="coerce")
+
+
+        #[COLUMNS] We ADD a new helper column for lives lost with missing values filled.
+        #Make a new column called LIVES_LOST_CLEAN where missing lives-lost values are treated
+        #as 0 and everything is stored as whole numbers.
+        df["LIVES_LOST_CLEAN"] = df["LIVES LOST"].fillna(0).astype("int32")
+
+        #Store VESSEL TYPE as a category: each unique type string is kept once and
+        #every row just holds a small integer code, which makes grouping and
+        #filtering by type much faster (and the column much smaller).
+        df["VESSEL TYPE"] = df["VESSEL TYPE"].astype("category")
+
+        #We make new DECADE and CENTURY columns with NumPy math on the whole column at once,
+        #instead of calling a lambda for every single row.
+        y = df["YEAR"].to_numpy()
+
+        df["DECADE"] = np.floor(y / 10) * 10
+        #Cut every year down to the nearest decade (like 1895 to 1890).
+        #np.floor keeps missing years (NaN) missing, so we don't need a pd.notna check per row.
+
+        df["CENTURY"] = np.floor(y / 100) + 1
+        #Figure out which century each year belongs to (like 1895 becomes 19th century).
+        #Again NaN stays NaN for missing years.
+
+        #Store the year columns as pandas nullable integers instead of floats:
+        #missing values stay missing (pd.NA), but comparisons and grouping run on
+        #whole numbers and the columns take half the memory.
+        df["YEAR"] = df["YEAR"].astype("Int32")
+        df["DECADE"] = df["DECADE"].astype("Int16")
+        df["CENTURY"] = df["CENTURY"].astype("Int16")
+
+        #Create a new column called HAS_COORDS that says True when a shipwreck has both latitude and longitude
+        #filled in (so we can put it on the map), and False if one or both are missing
+        #[FILTER1] single-condition filter (coords must both exist)
+        df["HAS_COORDS"] = df["LATITUDE"].notna() & df["LONGITUDE"].notna()
+
+        #Keep only the columns the app actually uses. The CSV has ~38 columns
+        #(tonnage, ports, cargo values, ...) that no view or tooltip ever reads,
+        #and every filter/copy/groupby would otherwise drag them along.
+        df = df[
+            ["SHIP'S NAME", "YEAR", "VESSEL TYPE", "LIVES LOST",
+             "LIVES_LOST_CLEAN", "LATITUDE", "LONGITUDE", "HAS_COORDS",
+             "DECADE", "CENTURY", "LOCATION LOST", "CAUSE OF LOSS"]
+        ]
 
-    #Create a new column called HAS_COORDS that says True when a shipwreck has both latitude and longitude
-    #filled in (so we can put it on the map), and False if one or both are missing
-    #[FILTER1] single-condition filter (coords must both exist)
-    df["HAS_COORDS"] = df["LATITUDE"].notna() & df["LONGITUDE"].notna()
+        try:
+            df.to_parquet("ShipwreckDatabase.parquet")
+        except Exception:
+            pass  # no parquet support (or read-only disk) — just keep using the CSV path
+
+    #Precompute the little summary numbers main() needs for the sidebar widgets.
+    #Because load_data is cached, these get computed once instead of the whole
+    #column being re-scanned on every widget change.
+    years = df["YEAR"].dropna()
+    meta = {
+        "min_year": int(years.min()) if not years.empty else 1705,
+        "max_year": int(years.max()) if not years.empty else 2000,
+        "max_lives": int(df["LIVES_LOST_CLEAN"].max()),
+        #[LISTCOMP] build list of vessel types (skipping blanks)
+        "vessel_types": sorted(
+            v for v in df["VESSEL TYPE"].dropna().unique() if str(v).strip() != ""
+        ),
+    }
 
-    return df
+    return df, meta
 
 
 #3. HELPER FUNCTIONS
 
 #[FUNC2P] function with 2+ parameters, one has a default value
+#st.cache_data remembers the result for each combination of filter values,
+#so moving between views with the same filters doesn't redo the filtering.
+@st.cache_data(max_entries=32, show_spinner=False)
 def filter_wrecks(df, year_range, vessel_types=None, min_lives_lost=0):
 
     """
@@ -101,44 +152,116 @@ def filter_wrecks(df, year_range, vessel_types=None, min_lives_lost=0):
 
     #[FILTER2] combine multiple conditions with AND only keep the rows where ALL THREE CONDITIONS are True.
     mask = year_mask & type_mask & lives_mask
-    #Get only the rows where mask is True, and make a fresh copy of that data.
-    filtered_df = df[mask].copy()
-    return filtered_df
+    #Get only the rows where mask is True. Boolean indexing already builds a
+    #brand-new DataFrame, and the views only read from the result, so there is
+    #no need to pay for an extra .copy() of the whole filtered data here
+    #(show_map_view copies its own much smaller coordinate subset before it
+    #adds the color columns).
+    return df[mask]
+
+
+#Cached aggregation helpers: each view's groupby/pivot/sort is expensive,
+#so we cache the results and only recompute when the filtered data changes
+#(not every time the user clicks the view radio button).
+
+@st.cache_data(show_spinner=False)
+def vessel_counts(filtered):
+    """Count wrecks per vessel type, biggest first."""
+    #value_counts builds the whole frequency table in one pass and already
+    #returns it sorted with the biggest count first, so no separate groupby/sort.
+    counts = (
+        filtered["VESSEL TYPE"].value_counts()#Count how many shipwrecks each type has.
+        .rename_axis("VESSEL TYPE")
+        .reset_index(name="WRECK COUNT")#Turn it back into a normal DataFrame with a "WRECK COUNT" column.
+    )
+    #VESSEL TYPE is a category column, so value_counts also lists types with
+    #0 wrecks in the current selection; drop those so they don't become empty bars.
+    return counts[counts["WRECK COUNT"] > 0]
 
 
-#[FUNCRETURN2] function returning two values
-def get_year_limits(df):
-    """
-    Find the minimum and maximum YEAR values in the data.
-    Returns (min_year, max_year).
-    """
-    years = df["YEAR"].dropna()#use the year column and drop years that are missing,so we get a clean list/Series of only the real year numbers.
-    if years.empty:#Check if the column is empty
-        return 1705, 2000  # fallback just in case
-    return int(years.min()), int(years.max())
+@st.cache_data(show_spinner=False)
+def yearly_counts(filtered):
+    """Count wrecks per year."""
+    return (
+        filtered.dropna(subset=["YEAR"])#Ignore any rows that don't have a year.
+        .groupby("YEAR")["SHIP'S NAME"]#Group all shipwrecks by year.
+        .count()#Count how many shipwrecks were in each year.
+        .reset_index(name="WRECK COUNT")#Turn it back into a DataFrame and name the count column "WRECK COUNT."
+    )
+
+
+@st.cache_data(show_spinner=False)
+def decade_type_pivot(filtered):
+    """Build the decade x vessel type count table."""
+    # #[PIVOTTABLE] pivot-style count table: rows are DECADES, columns are vessel types.
+    #groupby().size().unstack() counts the rows directly through pandas' fast
+    #grouping path instead of pivot_table's generic aggfunc machinery.
+    return (
+        filtered.groupby(["DECADE", "VESSEL TYPE"])
+        .size()#How many wrecks fall into each decade/type combination.
+        .unstack(fill_value=0)#Spread vessel types into columns; 0 where no wrecks happened.
+    )
+
+
+@st.cache_data(show_spinner=False)
+def map_center(filtered):
+    """Average latitude/longitude of the wrecks that have coordinates."""
+    coords = filtered.loc[filtered["HAS_COORDS"], ["LATITUDE", "LONGITUDE"]].to_numpy()
+    if len(coords) == 0:
+        return 0.0, 0.0  # fallback just in case nothing has coordinates
+    return float(coords[:, 0].mean()), float(coords[:, 1].mean())
+
+
+@st.cache_data(show_spinner=False)
+def deadliest_top10(filtered):
+    """Return the 10 wrecks with the most lives lost."""
+    #nlargest only tracks the current top 10 while it scans, instead of
+    #fully sorting (and copying) the whole filtered frame just to keep 10 rows.
+    return filtered.nlargest(10, "LIVES_LOST_CLEAN")
 
 
 #4. INDIVIDUAL VIEW FUNCTIONS
 
-#map
-def show_map_view(filtered):
-    st.header("Map of Shipwreck Locations")#header
+#st.cache_resource (not cache_data) because a Deck is a live object that
+#can't be copied or serialized. Keyed on the small tuple of filter values, so
+#coming back to the Map view with unchanged filters reuses the same deck
+#instead of rebuilding the layer and re-uploading every point.
+@st.cache_resource(max_entries=8, show_spinner=False)
+def build_deck(filters_key, _map_data):
+    """
+    Build the pydeck map for one combination of filters.
 
-    # Use only rows that have coordinates
-    map_data = filtered[filtered["HAS_COORDS"]].copy()
-    #If we filtered so much that no wrecks have coordinates left,show a message and STOP running the rest of this function.
-    if map_data.empty:
-        st.info("No wrecks with valid coordinates for the current filters.")
-        return
+    filters_key is the cache key; _map_data starts with an underscore so
+    Streamlit doesn't hash the DataFrame itself (the filters already
+    determine its contents).
+    """
+    map_data = _map_data.copy()
 
-    #Find the average latitude and average longitude. Use this as the spot where the map should center.
-    center_lat = map_data["LATITUDE"].mean()
-    center_lon = map_data["LONGITUDE"].mean()
+    #Find the average latitude and average longitude (cached helper).
+    #Use this as the spot where the map should center.
+    center_lat, center_lon = map_center(map_data)
 
     # Color code: green if 0 lives lost, red if > 0
-    map_data["COLOR"] = map_data["LIVES_LOST_CLEAN"].apply(
-        lambda x: [0, 180, 0, 160] if x == 0 else [220, 0, 0, 200]
-    )#[R, G, B, transparency]
+    #Build the colors with one boolean mask instead of a lambda per row,
+    #and store them as four small-number (uint8) columns that pydeck can read directly.
+    mask = map_data["LIVES_LOST_CLEAN"].to_numpy() == 0
+    colors = np.empty((len(map_data), 4), dtype=np.uint8)
+    colors[mask] = [0, 180, 0, 160]    # green for no lives lost
+    colors[~mask] = [220, 0, 0, 200]   # red for lives lost
+    map_data[["R", "G", "B", "A"]] = colors  #[R, G, B, transparency]
+
+    #Only send pydeck the columns the layer and the tooltip actually use.
+    #Every extra column would be serialized and shipped to the browser for nothing.
+    map_data = map_data[
+        ["LONGITUDE", "LATITUDE", "R", "G", "B", "A",
+         "SHIP'S NAME", "YEAR", "VESSEL TYPE", "LIVES LOST"]
+    ]
+
+    #Shrink the coordinates to float32 before serialization: deck.gl renders
+    #in float32 on the GPU anyway, and the smaller numbers mean fewer bytes
+    #(and fewer decimal digits) shipped to the browser per wreck. Together with
+    #the uint8 color columns, everything the layer reads is a compact typed column.
+    map_data = map_data.astype({"LONGITUDE": np.float32, "LATITUDE": np.float32})
 
     layer = pdk.Layer(
         "ScatterplotLayer",
@@ -151,8 +274,9 @@ def show_map_view(filtered):
         radius_min_pixels=3,#Smallest size the dot is allowed to shrink to.
         radius_max_pixels=50,#Biggest size the dot is allowed to grow to.
         get_position=["LONGITUDE", "LATITUDE"],#This tells PyDeck the exact coordinates for each dot.
-        get_radius="radius",#tells PyDeck which column controls the size of each dot.
-        get_fill_color="COLOR",  #ed/green colors
+        get_radius=30,#every dot gets the same radius (there is no per-row radius column),
+        #so PyDeck sends one constant instead of a value for every single wreck.
+        get_fill_color=["R", "G", "B", "A"],  #red/green colors from the four uint8 columns
         get_line_color=[0, 0, 0],  # black outline
     )
 
@@ -167,13 +291,27 @@ def show_map_view(filtered):
         "text": "{SHIP'S NAME}\nYear: {YEAR}\nType: {VESSEL TYPE}\nLives lost: {LIVES LOST}"
     }#When you hover over a dot, show a little popup box with information about that shipwreck.
 
-    deck = pdk.Deck(
+    return pdk.Deck(
         layers=[layer],
-        initial_view_state=view_state,#When you hover over a dot, show a little popup box with information about that shipwreck.
+        initial_view_state=view_state,
         tooltip=tooltip,#Enable tooltips on hover.
         map_style="mapbox://styles/mapbox/streets-v11",
     )
 
+
+#map
+def show_map_view(filtered, filters_key):
+    st.header("Map of Shipwreck Locations")#header
+
+    # Use only rows that have coordinates
+    map_data = filtered[filtered["HAS_COORDS"]]
+    #If we filtered so much that no wrecks have coordinates left,show a message and STOP running the rest of this function.
+    if map_data.empty:
+        st.info("No wrecks with valid coordinates for the current filters.")
+        return
+
+    deck = build_deck(filters_key, map_data)#cached: rebuilt only when the filters change
+
     st.pydeck_chart(deck)#Put this PyDeck map on the Streamlit page.
 
     st.caption("Green dots = no lives lost, red dots = lives were lost.")#caption
@@ -186,15 +324,8 @@ def show_vessel_chart_view(filtered):#making a function that takes the filtered
         st.info("No wrecks match the current filters.")
         return
 
-    # if it works, Count number of wrecks per vessel type
-    counts = (
-        filtered.groupby("VESSEL TYPE")#Group the rows by vessel type.
-        ["SHIP'S NAME"].count()#Count how many shipwrecks are in each group.
-        .reset_index(name="WRECK COUNT")#Turn it back into a normal DataFrame and rename the count column "WRECK COUNT".
-    )
-
-    #[SORT] sort so the biggest bar comes first
-    counts = counts.sort_values("WRECK COUNT", ascending=False)
+    # if it works, Count number of wrecks per vessel type (cached helper)
+    counts = vessel_counts(filtered)
 
     #[CHART1] bar chart
     fig = px.bar( #Use Plotly Express to make a bar graph:
@@ -211,8 +342,8 @@ def show_vessel_chart_view(filtered):#making a function that takes the filtered
 
     st.plotly_chart(fig, use_container_width=True)#Show the bar graph on the Streamlit page.
 
-    # #[MAXMIN] find vessel type with highest count
-    max_row = counts.iloc[counts["WRECK COUNT"].idxmax()]#index location of the largest number and pull that row out
+    # #[MAXMIN] vessel type with highest count is the first row (counts are sorted descending)
+    max_row = counts.iloc[0]
     st.write( #Show the user which vessel type had the most wrecks.
         f"The most frequently wrecked vessel type is **{max_row['VESSEL TYPE']}** "
         f"with **{int(max_row['WRECK COUNT'])}** wrecks in the current selection."
@@ -229,13 +360,8 @@ def show_time_trend_view(filtered):
         st.info("No wrecks match the current filters.")
         return
 
-    #Count wrecks per year
-    yearly = (
-        filtered.dropna(subset=["YEAR"])#Ignore any rows that don’t have a year.
-        .groupby("YEAR")["SHIP'S NAME"]#Group all shipwrecks by year.
-        .count()#Count how many shipwrecks were in each year.
-        .reset_index(name="WRECK COUNT")#Turn it back into a DataFrame and name the count column “WRECK COUNT.”
-    )
+    #Count wrecks per year (cached helper)
+    yearly = yearly_counts(filtered)
 
     #[CHART2] line chart (different from bar chart)
     fig = px.line(#Make a line chart
@@ -253,14 +379,15 @@ def show_time_trend_view(filtered):
 
     st.subheader("Wrecks by Decade and Vessel Type")
 
-    # #[PIVOTTABLE] pivot table summarizing counts
-    pivot = filtered.pivot_table(
-        index="DECADE",#Rows of the pivot table are DECADES:
-        columns="VESSEL TYPE",#The columns of the table are vessel types
-        values="SHIP'S NAME",#We are counting ship names.
-        aggfunc="count",#We count how many wrecks fall into each decade/type combination.
-        fill_value=0,#If no wrecks happened for that combo, show 0 instead of NaN.
-    )
+    #Only build the big decade x type table when there is something to cross:
+    #with a single decade or a single vessel type in the selection, the pivot
+    #repeats what the line chart already shows, so skip the work and say so.
+    if filtered["DECADE"].nunique() <= 1 or filtered["VESSEL TYPE"].nunique() <= 1:
+        st.info("Only one decade or vessel type in this selection — nothing to cross-tabulate.")
+        return
+
+    #Decade x vessel type counts (cached helper)
+    pivot = decade_type_pivot(filtered)
     st.dataframe(pivot)#Show the pivot table as a scrollable, sortable table in Streamlit.
 
 
@@ -272,11 +399,8 @@ def show_deadliest_view(filtered):
         st.info("No wrecks match the current filters.")
         return
 
-    #Sort by lives lost (descending)
-    deadly = filtered.sort_values("LIVES_LOST_CLEAN", ascending=False)
-
-    #Top 10 deadliest
-    top10 = deadly.head(10)
+    #Top 10 deadliest (cached helper)
+    top10 = deadliest_top10(filtered)
     #Show a table with the 10 deadliest wrecks and only the important columns.
     st.write("Top 10 deadliest wrecks in the current selection:")
     st.dataframe(
@@ -288,27 +412,26 @@ def show_deadliest_view(filtered):
 
     st.subheader("Summary Statistics")
 
+    #Pull the lives-lost numbers out once and run every reduction on that one
+    #array, instead of scanning the column separately for each statistic.
+    lives = filtered["LIVES_LOST_CLEAN"].to_numpy()
+
     # Build a dictionary of stats
     stats = {
         "Total wrecks in this selection": len(filtered),#Count how many rows are in the filtered dataset.
-        "Wrecks with at least 1 life lost": int(
-            (filtered["LIVES_LOST_CLEAN"] > 0).sum()#True for wrecks where someone died
-        ),#sum converts True = 1, False = 0, so it counts them
-        "Total lives lost in this selection": int(filtered["LIVES_LOST_CLEAN"].sum()),
+        "Wrecks with at least 1 life lost": int((lives > 0).sum()),
+        #sum converts True = 1, False = 0, so it counts the wrecks where someone died
+        "Total lives lost in this selection": int(lives.sum()),
         # Add up ALL lives lost across all wrecks in the selection.
-        "Maximum lives lost in a single wreck": int(
-            filtered["LIVES_LOST_CLEAN"].max() #Find the single deadliest wreck.
-        ),
+        "Maximum lives lost in a single wreck": int(lives.max()),#the single deadliest wreck
     }
 
     cols = st.columns(2)#Make 2 side-by-side columns to make the dashboard look clean.
-    i = 0
 
-    # #[ITERLOOP] loop through dict items
-    for label, value in stats.items():#gives each (key, value) pair Put it in one of the two columns
-        with cols[i % 2]:#switches between left column (0) and right column (1)
+    # #[ITERLOOP] pair each stat with a column, alternating left and right
+    for col, (label, value) in zip(itertools.cycle(cols), stats.items()):
+        with col:
             st.metric(label=label, value=str(value))
-        i += 1
 
     # #[DICTMETHOD] using .keys() method
     stat_names = ", ".join(stats.keys())#list of dictionary keys
@@ -324,11 +447,11 @@ def main():
         layout="wide",#Make the page layout wide, so charts look bigger
     )
 
-    #Load the data once
-    df = load_data()
+    #Load the data (and its precomputed summary facts) once
+    df, meta = load_data()
 
-    #[FUNCCALL2]
-    min_year, max_year = get_year_limits(df)#Call the helper function to find the earliest and latest years in the dataset.
+    #[FUNCRETURN2] earliest and latest years, computed once inside cached load_data
+    min_year, max_year = meta["min_year"], meta["max_year"]
 
     #Sidebar
     st.sidebar.title("Filters")#Creates a sidebar section called “Filters.”
@@ -342,10 +465,9 @@ def main():
         step=1
     )
 
-    #[LISTCOMP] build list of vessel types (skipping blanks)
-    vessel_types = sorted(
-        [v for v in df["VESSEL TYPE"].dropna().unique() if str(v).strip() != ""]
-    )#remove empty strings, values, keep unique one and display
+    #List of vessel types, built once inside cached load_data instead of
+    #re-scanning the column and re-sorting the list on every rerun.
+    vessel_types = meta["vessel_types"]
 
     #[ST1] multiselect for vessel type
     selected_types = st.sidebar.multiselect(#Let the user choose multiple vessel types.
@@ -357,7 +479,7 @@ def main():
     min_lives = st.sidebar.number_input(#Let user filter for shipwrecks where at least X people died.
         "Minimum lives lost",
         min_value=0,
-        max_value=int(df["LIVES_LOST_CLEAN"].max()),
+        max_value=meta["max_lives"],#precomputed in load_data, no column scan per rerun
         value=0,
         step=1
     )
@@ -371,10 +493,14 @@ def main():
 
     # Apply filters using our helper function
     #[FUNCCALL2] filter_wrecks is called here
+    #One small hashable tuple describing the current filter settings: used as
+    #the cache key both here and for the cached map deck.
+    filters_key = (year_range, tuple(sorted(selected_types)), min_lives)
+
     filtered = filter_wrecks(#Send all the selected filters to your filter_wrecks function.
         df,
         year_range=year_range,
-        vessel_types=selected_types,
+        vessel_types=filters_key[1],#tuple so the cache key is stable
         min_lives_lost=min_lives
     )#Returns a new DataFrame containing only rows that match the filters.
 
@@ -391,7 +517,7 @@ def main():
 
     # Show the chosen view
     if view_choice == "Map":
-        show_map_view(filtered)
+        show_map_view(filtered, filters_key)
     elif view_choice == "Vessel Types":
         show_vessel_chart_view(filtered)
     elif view_choice == "Time Trends":